@@ -1,5 +1,6 @@
 """LLM Service for code generation and validation."""
 
+from llm_executor.llm_service.cache import LLMCache
 from llm_executor.llm_service.orchestration import (
     LLMOrchestrationFlow,
     InputParserNode,
@@ -11,6 +12,7 @@ from llm_executor.llm_service.orchestration import (
 )
 
 __all__ = [
+    "LLMCache",
     "LLMOrchestrationFlow",
     "InputParserNode",
     "CodeGenerationNode",
@@ -16,7 +16,7 @@ from pydantic import BaseModel, Field
 
 from llm_executor.llm_service.orchestration import LLMOrchestrationFlow
 from llm_executor.shared.config import LLMServiceConfig
-from llm_executor.shared.logging_util import get_logger
+from llm_executor.shared.logging_util import get_logger, set_request_id, reset_request_id
 from llm_executor.shared.models import CodeComplexity
 
 
@@ -108,20 +108,25 @@ app.add_middleware(
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
     """Add request ID to all requests and propagate through pipeline."""
-    request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+    # Only generate an ID when the caller did not supply one
+    request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
     request.state.request_id = request_id
+    token = set_request_id(request_id)
     
-    # Add request ID to logger context
+    # The request ID comes from the logging context set above
     logger.info(
         "Incoming request",
         extra={
-            "request_id": request_id,
             "method": request.method,
             "path": request.url.path,
         }
     )
     
-    response = await call_next(request)
+    try:
+        response = await call_next(request)
+    finally:
+        # Restore the outer value rather than overwriting it with None
+        reset_request_id(token)
     response.headers["X-Request-ID"] = request_id
     
     return response
@@ -0,0 +1,118 @@
+"""Response cache for deterministic LLM calls.
+
+This module provides a cache that stores LLM responses keyed by a hash of
+the request, so repeated prompts (e.g. the same query re-submitted, or CI
+runs against a live LLM) are served from the cache instead of making
+another LLM round-trip.
+"""
+
+import hashlib
+import json
+from typing import MutableMapping, Optional
+
+
+class LLMCache:
+    """Caches LLM responses for deterministic (temperature 0) requests."""
+
+    def __init__(
+        self,
+        backend: Optional[MutableMapping[str, str]] = None,
+        model: str = "",
+        temperature: float = 0.0,
+        max_entries: int = 1024,
+    ):
+        """Initialize the LLM cache.
+
+        Args:
+            backend: Mapping used to store responses (e.g. a dict or a
+                    Redis-backed mapping). If None, uses an in-memory dict.
+            model: Name of the model the responses come from; part of the key
+            temperature: Sampling temperature assumed for clients that do not
+                        expose a ``temperature`` attribute. Responses are only
+                        cached when the effective temperature is 0.
+            max_entries: Maximum number of cached responses in the default
+                        in-memory dict; the oldest entry is evicted when the
+                        limit is reached. Caller-provided backends are expected
+                        to manage their own size (e.g. Redis maxmemory).
+        """
+        self.backend = backend if backend is not None else {}
+        # Only the default in-memory dict is bounded by max_entries
+        self._bounded = backend is None
+        self.model = model
+        self.temperature = temperature
+        self.max_entries = max_entries
+
+    def cache_key(self, prompt: str, temperature: Optional[float] = None) -> Optional[str]:
+        """Build the cache key for a prompt.
+
+        Args:
+            prompt: Prompt sent to the LLM
+            temperature: Sampling temperature of the request. If None, uses
+                        the cache's default temperature.
+
+        Returns:
+            SHA-256 hex digest identifying the request, or None if the
+            request is non-deterministic and must not be cached
+        """
+        if temperature is None:
+            temperature = self.temperature
+        if temperature > 0:
+            return None
+
+        payload = json.dumps(
+            {"model": self.model, "prompt": prompt, "temperature": float(temperature)},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Cached response or None if not cached
+        """
+        return self.backend.get(key)
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response in the cache.
+
+        Args:
+            key: Cache key from cache_key()
+            response: LLM response to cache
+        """
+        # Only the default dict is bounded here: it preserves insertion order
+        # and has O(1) len(), whereas iterating a caller-provided mapping may
+        # scan its whole keyspace and yield keys in arbitrary order
+        if (
+            self._bounded
+            and key not in self.backend
+            and len(self.backend) >= self.max_entries
+        ):
+            # Evict the oldest entry
+            del self.backend[next(iter(self.backend))]
+        self.backend[key] = response
+
+    def generate(self, llm_client, prompt: str) -> str:
+        """Return the cached response for a prompt, calling the LLM on a miss.
+
+        Args:
+            llm_client: LLM client exposing generate(prompt), and optionally
+                       the ``temperature`` it samples with
+            prompt: Prompt to send to the LLM
+
+        Returns:
+            LLM response for the prompt
+        """
+        temperature = getattr(llm_client, "temperature", self.temperature)
+        key = self.cache_key(prompt, temperature)
+        if key is None:
+            return llm_client.generate(prompt)
+
+        response = self.get(key)
+        if response is None:
+            response = llm_client.generate(prompt)
+            self.set(key, response)
+        return response
@@ -4,12 +4,13 @@ This module implements the LangGraph workflow that orchestrates code generation,
 validation, correction, and routing for the LLM-Driven Secure Python Execution Platform.
 """
 
-from typing import TypedDict, Annotated, Sequence, Literal
+from typing import TypedDict, Annotated, Optional, Sequence, Literal
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import BaseMessage
 
 from llm_executor.executor.validator import CodeValidator
 from llm_executor.executor.classifier import CodeClassifier
+from llm_executor.llm_service.cache import LLMCache
 from llm_executor.shared.models import (
     ValidationResult,
     CodeComplexity,
@@ -59,14 +60,17 @@ class InputParserNode:
 class CodeGenerationNode:
     """Calls LLM with structured prompts to generate Python code."""
     
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, llm_cache: Optional[LLMCache] = None):
         """Initialize the code generation node.
         
         Args:
             llm_client: Optional LLM client for code generation.
                        If None, uses a mock implementation.
+            llm_cache: Optional cache for LLM responses.
+                      If None, every prompt is sent to the LLM.
         """
         self.llm_client = llm_client
+        self.llm_cache = llm_cache
     
     def __call__(self, state: GraphState) -> GraphState:
         """Generate Python code from the query using LLM.
@@ -114,6 +118,8 @@ Requirements:
 Return only the Python code, no explanations."""
         
         # Placeholder for actual LLM call
+        if self.llm_cache is not None:
+            return self.llm_cache.generate(self.llm_client, prompt)
         response = self.llm_client.generate(prompt)
         return response
     
@@ -161,14 +167,17 @@ class CodeValidatorNode:
 class CorrectionNode:
     """Sends validation errors back to LLM for code correction."""
     
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, llm_cache: Optional[LLMCache] = None):
         """Initialize the correction node.
         
         Args:
             llm_client: Optional LLM client for code correction.
                        If None, uses a mock implementation.
+            llm_cache: Optional cache for LLM responses.
+                      If None, every prompt is sent to the LLM.
         """
         self.llm_client = llm_client
+        self.llm_cache = llm_cache
     
     def __call__(self, state: GraphState) -> GraphState:
         """Request corrected code from LLM based on validation errors.
@@ -237,6 +246,8 @@ Please generate corrected Python code that:
 Return only the corrected Python code, no explanations."""
         
         # Placeholder for actual LLM call
+        if self.llm_cache is not None:
+            return self.llm_cache.generate(self.llm_client, prompt)
         response = self.llm_client.generate(prompt)
         return response
     
@@ -326,14 +337,17 @@ def check_validation_result(state: GraphState) -> Literal["valid", "invalid"]:
 class LLMOrchestrationFlow:
     """LangGraph orchestration flow for the LLM Service."""
     
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, llm_cache: Optional[LLMCache] = None):
         """Initialize the orchestration flow.
         
         Args:
             llm_client: Optional LLM client for code generation and correction.
                        If None, uses mock implementations for testing.
+            llm_cache: Optional cache for LLM responses, shared by the code
+                      generation and correction nodes.
         """
         self.llm_client = llm_client
+        self.llm_cache = llm_cache
         self.graph = self._build_graph()
     
     def _build_graph(self) -> StateGraph:
@@ -347,9 +361,9 @@ class LLMOrchestrationFlow:
         
         # Add nodes
         workflow.add_node("input_parser", InputParserNode())
-        workflow.add_node("code_generation", CodeGenerationNode(self.llm_client))
+        workflow.add_node("code_generation", CodeGenerationNode(self.llm_client, self.llm_cache))
         workflow.add_node("code_validator", CodeValidatorNode())
-        workflow.add_node("correction", CorrectionNode(self.llm_client))
+        workflow.add_node("correction", CorrectionNode(self.llm_client, self.llm_cache))
         workflow.add_node("execution_router", ExecutionRouterNode())
         
         # Set entry point
@@ -9,7 +9,7 @@ from llm_executor.shared.models import (
     CodeComplexity,
     JobCreationRequest,
 )
-from llm_executor.shared.logging_util import get_logger, setup_logging, set_request_id, clear_request_id
+from llm_executor.shared.logging_util import get_logger, setup_logging, set_request_id, reset_request_id, clear_request_id
 from llm_executor.shared.config import BaseConfig, LLMServiceConfig, ExecutorServiceConfig, HeavyJobRunnerConfig
 from llm_executor.shared.exceptions import (
     ValidationError,
@@ -43,6 +43,7 @@ __all__ = [
     "get_logger",
     "setup_logging",
     "set_request_id",
+    "reset_request_id",
     "clear_request_id",
     "BaseConfig",
     "LLMServiceConfig",
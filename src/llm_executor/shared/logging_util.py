@@ -5,47 +5,60 @@ import json
 import sys
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 
 # Context variable to store request_id across async contexts
 request_id_context: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
+# Accepted logging level names mapped to their numeric levels, including the
+# standard aliases (WARN, FATAL) and NOTSET
+LOG_LEVELS: Dict[str, int] = logging.getLevelNamesMapping()
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON logs."""
 
+    # Standard logging fields to exclude from extra data
+    EXCLUDED_FIELDS = frozenset({
+        "name", "msg", "args", "created", "filename", "funcName",
+        "levelname", "levelno", "lineno", "module", "msecs", "message",
+        "pathname", "process", "processName", "relativeCreated",
+        "thread", "threadName", "exc_info", "exc_text", "stack_info",
+        "taskName"
+    })
+
+    # Fields skipped when copying extras; service (and request_id when it
+    # comes from context) are already set on the log entry
+    _SKIP_FIELDS = EXCLUDED_FIELDS | {"service"}
+    _SKIP_FIELDS_WITH_REQUEST_ID = _SKIP_FIELDS | {"request_id"}
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
+        # Reuse the time captured when the record was created instead of
+        # reading the clock a second time
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc)
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": timestamp.isoformat().replace("+00:00", "Z"),
             "level": record.levelname,
             "service": getattr(record, "service", "unknown"),
             "message": record.getMessage(),
         }
 
-        # Standard logging fields to exclude from extra data
-        excluded_fields = {
-            "name", "msg", "args", "created", "filename", "funcName",
-            "levelname", "levelno", "lineno", "module", "msecs", "message",
-            "pathname", "process", "processName", "relativeCreated",
-            "thread", "threadName", "exc_info", "exc_text", "stack_info",
-            "taskName"
-        }
-
         # Add request_id from context first (highest priority)
         request_id = request_id_context.get()
         if request_id:
             log_data["request_id"] = request_id
+            skip_fields = self._SKIP_FIELDS_WITH_REQUEST_ID
+        else:
+            skip_fields = self._SKIP_FIELDS
         
-        # Add extra fields from record (including request_id if not from context)
-        for key, value in record.__dict__.items():
-            if key not in excluded_fields and value is not None:
-                # Skip service and request_id if already set
-                if key == "service" and "service" in log_data:
-                    continue
-                if key == "request_id" and "request_id" in log_data:
-                    continue
-                log_data[key] = value
+        # Add extra fields from record in one pass (including request_id if
+        # not from context)
+        log_data.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in skip_fields and value is not None
+        )
 
         # Add exception info if present
         if record.exc_info:
@@ -61,9 +74,18 @@ def setup_logging(service_name: str, level: str = "INFO") -> None:
     Args:
         service_name: Name of the service (e.g., "llm-service", "executor-service")
         level: Logging level (default: "INFO")
+
+    Raises:
+        ValueError: If level is not one of the supported level names
     """
+    log_level = LOG_LEVELS.get(level.upper())
+    if log_level is None:
+        raise ValueError(
+            f"Invalid log level '{level}', expected one of: {', '.join(LOG_LEVELS)}"
+        )
+
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
 
     # Remove existing handlers
     for handler in logger.handlers[:]:
@@ -71,7 +93,7 @@ def setup_logging(service_name: str, level: str = "INFO") -> None:
 
     # Create console handler with structured formatter
     handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, level.upper()))
+    handler.setLevel(log_level)
 
     formatter = StructuredFormatter()
     handler.setFormatter(formatter)
@@ -125,14 +147,27 @@ def get_logger(name: str, service: Optional[str] = None) -> logging.LoggerAdapte
     return adapter
 
 
-def set_request_id(request_id: str) -> None:
+def set_request_id(request_id: str) -> Token:
     """
     Set the request_id in the current context.
 
     Args:
         request_id: Request identifier to set
+
+    Returns:
+        Token that restores the previous request_id via reset_request_id()
+    """
+    return request_id_context.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    """
+    Restore the request_id that was set before the matching set_request_id().
+
+    Args:
+        token: Token returned by set_request_id()
     """
-    request_id_context.set(request_id)
+    request_id_context.reset(token)
 
 
 def clear_request_id() -> None:
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExecutionStatus(str, Enum):
@@ -20,8 +20,12 @@ class CodeComplexity(str, Enum):
     HEAVY = "heavy"
 
 
+# Models below defer building their validators and serializers until first
+# use, so importing this module (and every package re-exporting it) stays cheap.
 class ResourceLimits(BaseModel):
     """Resource limits for code execution."""
+    model_config = ConfigDict(defer_build=True)
+
     cpu_limit: str = Field(default="4", description="CPU limit (e.g., '4' for 4 cores)")
     memory_limit: str = Field(default="8Gi", description="Memory limit (e.g., '8Gi')")
     cpu_request: str = Field(default="2", description="CPU request")
@@ -32,6 +36,8 @@ class ResourceLimits(BaseModel):
 
 class CodeExecutionRequest(BaseModel):
     """Request for code execution."""
+    model_config = ConfigDict(defer_build=True)
+
     request_id: str = Field(..., description="Unique identifier for the request")
     code: str = Field(..., description="Python code to execute")
     timeout: int = Field(default=30, description="Timeout in seconds")
@@ -40,6 +46,8 @@ class CodeExecutionRequest(BaseModel):
 
 class ValidationResult(BaseModel):
     """Result of code validation."""
+    model_config = ConfigDict(defer_build=True)
+
     is_valid: bool = Field(..., description="Whether the code passed validation")
     errors: List[str] = Field(default_factory=list, description="List of validation errors")
     warnings: List[str] = Field(default_factory=list, description="List of validation warnings")
@@ -47,6 +55,8 @@ class ValidationResult(BaseModel):
 
 class ExecutionResult(BaseModel):
     """Result of code execution."""
+    model_config = ConfigDict(defer_build=True)
+
     request_id: str = Field(..., description="Request identifier")
     stdout: str = Field(default="", description="Standard output from execution")
     stderr: str = Field(default="", description="Standard error from execution")
@@ -57,6 +67,8 @@ class ExecutionResult(BaseModel):
 
 class JobCreationRequest(BaseModel):
     """Request for creating a Kubernetes Job."""
+    model_config = ConfigDict(defer_build=True)
+
     request_id: str = Field(..., description="Request identifier")
     code: str = Field(..., description="Python code to execute")
     resource_limits: ResourceLimits = Field(default_factory=ResourceLimits, description="Resource limits for the job")
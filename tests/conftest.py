@@ -0,0 +1,28 @@
+"""Shared pytest fixtures for the test suite."""
+
+import httpx
+import pytest
+
+
+@pytest.fixture(scope="session")
+async def llm_client():
+    """Create an async test client for the LLM Service, shared by the session.
+
+    Requests are sent straight to the ASGI app without a sync-to-async bridge.
+    ASGITransport does not run the application lifespan, so it is entered
+    here to set up the orchestration flow once for the whole test run.
+
+    The app is imported here rather than at module level so that test
+    modules which never request this fixture do not pay for importing
+    FastAPI and loading the service configuration during collection.
+    """
+    from llm_executor.llm_service.api import app as llm_app
+
+    async with llm_app.router.lifespan_context(llm_app):
+        transport = httpx.ASGITransport(app=llm_app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://testserver",
+            headers={"Content-Type": "application/json"},
+        ) as async_client:
+            yield async_client
@@ -0,0 +1,128 @@
+"""Unit tests for the LLM response cache.
+
+This module contains unit tests for LLMCache and its integration with
+the LLM orchestration flow.
+"""
+
+import pytest
+
+from llm_executor.llm_service.cache import LLMCache
+from llm_executor.llm_service.orchestration import LLMOrchestrationFlow
+
+
+class StubLLMClient:
+    """LLM client stub that returns fixed code and counts calls."""
+
+    def __init__(self, code: str):
+        self.code = code
+        self.calls = 0
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        return self.code
+
+
+def test_repeated_prompt_is_served_from_cache():
+    """Test that the LLM is only called once for a repeated prompt."""
+    cache = LLMCache()
+    llm_client = StubLLMClient("result = 1 + 1")
+
+    first = cache.generate(llm_client, "Calculate 1 + 1")
+    second = cache.generate(llm_client, "Calculate 1 + 1")
+
+    assert first == second == "result = 1 + 1"
+    assert llm_client.calls == 1
+
+
+def test_cache_key_depends_on_model_and_prompt():
+    """Test that cache keys differ across models and prompts."""
+    cache_a = LLMCache(model="model-a")
+    cache_b = LLMCache(model="model-b")
+
+    assert cache_a.cache_key("query") == cache_a.cache_key("query")
+    assert cache_a.cache_key("query") != cache_a.cache_key("other query")
+    assert cache_a.cache_key("query") != cache_b.cache_key("query")
+
+
+def test_cache_key_normalises_integer_temperature():
+    """Test that an int temperature of 0 maps to the same key as 0.0."""
+    cache = LLMCache()
+
+    assert cache.cache_key("query", 0) == cache.cache_key("query", 0.0)
+
+
+def test_non_zero_temperature_is_not_cached():
+    """Test that non-deterministic requests always reach the LLM."""
+    cache = LLMCache(temperature=0.7)
+    llm_client = StubLLMClient("result = 1 + 1")
+
+    cache.generate(llm_client, "Calculate 1 + 1")
+    cache.generate(llm_client, "Calculate 1 + 1")
+
+    assert cache.cache_key("Calculate 1 + 1") is None
+    assert llm_client.calls == 2
+    assert len(cache.backend) == 0
+
+
+def test_sampling_client_is_not_cached_by_default_cache():
+    """Test that the client's own non-zero temperature disables caching."""
+    cache = LLMCache()
+    llm_client = StubLLMClient("result = 1 + 1")
+    llm_client.temperature = 0.9
+
+    cache.generate(llm_client, "Calculate 1 + 1")
+    cache.generate(llm_client, "Calculate 1 + 1")
+
+    assert llm_client.calls == 2
+    assert len(cache.backend) == 0
+
+
+def test_oldest_entry_evicted_at_max_entries():
+    """Test that the cache does not grow beyond max_entries."""
+    cache = LLMCache(max_entries=2)
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.set("c", "3")
+
+    assert len(cache.backend) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == "3"
+
+
+def test_custom_backend_is_used():
+    """Test that responses are stored in a caller-provided backend."""
+    backend = {}
+    cache = LLMCache(backend=backend)
+
+    cache.generate(StubLLMClient("result = 2 + 2"), "Calculate 2 + 2")
+
+    assert list(backend.values()) == ["result = 2 + 2"]
+
+
+def test_custom_backend_is_not_evicted():
+    """Test that size limits are left to caller-provided backends."""
+    backend = {}
+    cache = LLMCache(backend=backend, max_entries=1)
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+
+    assert len(backend) == 2
+
+
+def test_flow_reuses_cached_generation():
+    """Test that repeated queries through the flow hit the cache."""
+    llm_client = StubLLMClient("result = sum(range(10))")
+    flow = LLMOrchestrationFlow(llm_client=llm_client, llm_cache=LLMCache())
+
+    first_state = flow.execute("Sum the numbers from 0 to 9", max_retries=3)
+    second_state = flow.execute("Sum the numbers from 0 to 9", max_retries=3)
+
+    assert first_state["generated_code"] == second_state["generated_code"]
+    assert second_state["validation_result"].is_valid
+    assert llm_client.calls == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
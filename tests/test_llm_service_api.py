@@ -3,77 +3,81 @@
 This module contains unit tests for the FastAPI endpoints in the LLM Service.
 """
 
+import asyncio
+import json
+import logging
+
 import pytest
-from fastapi.testclient import TestClient
 
-from llm_executor.llm_service.api import app
+from llm_executor.llm_service.api import health_check
+from llm_executor.shared.logging_util import get_request_id
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+# Query request bodies, encoded once and posted as raw JSON bytes
+SIMPLE_QUERY = json.dumps({"query": "Calculate 1 + 1"}).encode()
+SECOND_QUERY = json.dumps({"query": "Calculate 2 + 2"}).encode()
+MINIMAL_QUERY = json.dumps({"query": "Print hello world"}).encode()
+FACTORIAL_QUERY = json.dumps({"query": "Calculate factorial of 5"}).encode()
+SIMPLE_QUERY_WITH_OPTIONS = json.dumps(
+    {"query": "Calculate 1 + 1", "timeout": 30, "max_retries": 3}
+).encode()
+SUM_QUERY_WITH_OPTIONS = json.dumps(
+    {"query": "Calculate the sum of numbers from 1 to 10", "timeout": 30, "max_retries": 3}
+).encode()
 
 
-def test_health_endpoint_returns_200(client):
-    """Test that /api/v1/health returns 200 status and service information.
+async def test_health_endpoint_returns_200(llm_client):
+    """Test that /api/v1/health returns 200 status and service information as JSON.
     
     Requirements: 6.5
     """
-    response = client.get("/api/v1/health")
+    response = await llm_client.get("/api/v1/health")
     
     # Verify status code
     assert response.status_code == 200
     
+    # Verify content type
+    assert response.headers["content-type"] == "application/json"
+    
     # Verify response structure
     data = response.json()
+    assert isinstance(data, dict)
     assert "status" in data
     assert "version" in data
     assert "service_name" in data
-    
-    # Verify response values
-    assert data["status"] == "healthy"
-    assert data["version"] == "0.1.0"
-    assert data["service_name"] == "llm-service"
 
 
-def test_health_endpoint_response_format(client):
-    """Test that health endpoint returns properly formatted JSON."""
-    response = client.get("/api/v1/health")
+async def test_health_check_reports_service_status():
+    """Test the health check values by calling the handler directly.
     
-    # Verify content type
-    assert response.headers["content-type"] == "application/json"
+    Only the payload is checked here, so the middleware stack is skipped.
     
-    # Verify response can be parsed as JSON
-    data = response.json()
-    assert isinstance(data, dict)
+    Requirements: 6.5
+    """
+    health = await health_check()
+    
+    assert health.status == "healthy"
+    assert health.version == "0.1.0"
+    assert health.service_name == "llm-service"
 
 
-def test_query_endpoint_exists(client):
+async def test_query_endpoint_exists(llm_client):
     """Test that the query endpoint exists and accepts POST requests."""
     # Send a simple query
-    response = client.post(
+    response = await llm_client.post(
         "/api/v1/query",
-        json={
-            "query": "Calculate 1 + 1",
-            "timeout": 30,
-            "max_retries": 3,
-        }
+        content=SIMPLE_QUERY_WITH_OPTIONS
     )
     
     # Should not return 404 (endpoint exists)
     assert response.status_code != 404
 
 
-def test_query_endpoint_with_valid_request(client):
+async def test_query_endpoint_with_valid_request(llm_client):
     """Test query endpoint with a valid request."""
-    response = client.post(
+    response = await llm_client.post(
         "/api/v1/query",
-        json={
-            "query": "Calculate the sum of numbers from 1 to 10",
-            "timeout": 30,
-            "max_retries": 3,
-        }
+        content=SUM_QUERY_WITH_OPTIONS
     )
     
     # Verify successful response
@@ -91,16 +95,11 @@ def test_query_endpoint_with_valid_request(client):
     assert len(data["request_id"]) > 0
 
 
-def test_query_endpoint_generates_request_id(client):
+async def test_query_endpoint_generates_request_id(llm_client):
     """Test that query endpoint generates a unique request ID."""
-    response1 = client.post(
-        "/api/v1/query",
-        json={"query": "Calculate 1 + 1"}
-    )
-    
-    response2 = client.post(
-        "/api/v1/query",
-        json={"query": "Calculate 2 + 2"}
+    response1, response2 = await asyncio.gather(
+        llm_client.post("/api/v1/query", content=SIMPLE_QUERY),
+        llm_client.post("/api/v1/query", content=SECOND_QUERY),
     )
     
     # Both should succeed
@@ -113,13 +112,13 @@ def test_query_endpoint_generates_request_id(client):
     assert data1["request_id"] != data2["request_id"]
 
 
-def test_query_endpoint_with_custom_request_id(client):
+async def test_query_endpoint_with_custom_request_id(llm_client):
     """Test that query endpoint respects X-Request-ID header."""
     custom_request_id = "test-request-123"
     
-    response = client.post(
+    response = await llm_client.post(
         "/api/v1/query",
-        json={"query": "Calculate 1 + 1"},
+        content=SIMPLE_QUERY,
         headers={"X-Request-ID": custom_request_id}
     )
     
@@ -131,11 +130,65 @@ def test_query_endpoint_with_custom_request_id(client):
     assert data["request_id"] == custom_request_id
 
 
-def test_query_endpoint_with_minimal_request(client):
+class RequestIdCapturingHandler(logging.Handler):
+    """Log handler that records the context request ID for each record."""
+
+    def __init__(self):
+        super().__init__()
+        self.request_ids = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.request_ids[record.getMessage()] = get_request_id()
+
+
+async def test_request_id_header_is_set_in_logging_context(llm_client):
+    """Test that logs emitted while handling a query carry the X-Request-ID value."""
+    custom_request_id = "test-request-context-456"
+    api_logger = logging.getLogger("llm_executor.llm_service.api")
+    handler = RequestIdCapturingHandler()
+    original_level = api_logger.level
+    api_logger.addHandler(handler)
+    api_logger.setLevel(logging.INFO)
+    
+    try:
+        response = await llm_client.post(
+            "/api/v1/query",
+            content=SIMPLE_QUERY,
+            headers={"X-Request-ID": custom_request_id}
+        )
+    finally:
+        api_logger.removeHandler(handler)
+        api_logger.setLevel(original_level)
+    
+    assert response.status_code == 200
+    
+    # Logged from inside process_query, so the middleware context applies
+    assert handler.request_ids["Processing query"] == custom_request_id
+    
+    # The middleware restores the previous context once the request is done
+    assert get_request_id() is None
+
+
+async def test_empty_request_id_header_generates_request_id(llm_client):
+    """Test that an empty X-Request-ID header is replaced with a generated ID."""
+    response = await llm_client.post(
+        "/api/v1/query",
+        content=SIMPLE_QUERY,
+        headers={"X-Request-ID": ""}
+    )
+    
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert len(data["request_id"]) > 0
+    assert response.headers.get("X-Request-ID") == data["request_id"]
+
+
+async def test_query_endpoint_with_minimal_request(llm_client):
     """Test query endpoint with minimal required fields."""
-    response = client.post(
+    response = await llm_client.post(
         "/api/v1/query",
-        json={"query": "Print hello world"}
+        content=MINIMAL_QUERY
     )
     
     # Should succeed with default values
@@ -146,11 +199,11 @@ def test_query_endpoint_with_minimal_request(client):
     assert "generated_code" in data
 
 
-def test_query_endpoint_validation_result(client):
+async def test_query_endpoint_validation_result(llm_client):
     """Test that query endpoint includes validation results."""
-    response = client.post(
+    response = await llm_client.post(
         "/api/v1/query",
-        json={"query": "Calculate factorial of 5"}
+        content=FACTORIAL_QUERY
     )
     
     assert response.status_code == 200
@@ -163,12 +216,12 @@ def test_query_endpoint_validation_result(client):
     assert isinstance(execution_result["validation_passed"], bool)
 
 
-def test_cors_headers_present(client):
+async def test_cors_headers_present(llm_client):
     """Test that CORS headers are properly configured."""
-    response = client.get("/api/v1/health")
+    response = await llm_client.get("/api/v1/health")
     
     # CORS headers should be present in the response
-    # Note: TestClient may not fully simulate CORS preflight, but middleware is configured
+    # Note: these requests do not simulate a CORS preflight, but middleware is configured
     assert response.status_code == 200
 
 
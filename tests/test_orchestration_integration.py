@@ -9,10 +9,14 @@ from llm_executor.llm_service.orchestration import LLMOrchestrationFlow
 from llm_executor.shared.models import CodeComplexity
 
 
-def test_simple_query_flow():
+@pytest.fixture(scope="module")
+def flow():
+    """Share one compiled orchestration flow across the module's tests."""
+    return LLMOrchestrationFlow()
+
+
+def test_simple_query_flow(flow):
     """Test a simple query that generates valid lightweight code."""
-    flow = LLMOrchestrationFlow()
-    
     query = "Calculate the sum of numbers from 1 to 10"
     final_state = flow.execute(query, max_retries=3)
     
@@ -26,10 +30,8 @@ def test_simple_query_flow():
     assert final_state["validation_attempts"] == 0  # No retries needed
 
 
-def test_query_with_validation_failure():
+def test_query_with_validation_failure(flow):
     """Test a query that might generate code requiring correction."""
-    flow = LLMOrchestrationFlow()
-    
     query = "Read a file from disk"
     final_state = flow.execute(query, max_retries=3)
     
@@ -40,10 +42,8 @@ def test_query_with_validation_failure():
     # In a real implementation with an actual LLM, this might fail validation
 
 
-def test_max_retries_enforcement():
+def test_max_retries_enforcement(flow):
     """Test that max retries is properly enforced."""
-    flow = LLMOrchestrationFlow()
-    
     query = "Execute a system command"
     max_retries = 2
     final_state = flow.execute(query, max_retries=max_retries)
@@ -53,10 +53,8 @@ def test_max_retries_enforcement():
     assert final_state["max_retries"] == max_retries
 
 
-def test_state_preservation():
+def test_state_preservation(flow):
     """Test that state is properly preserved throughout the flow."""
-    flow = LLMOrchestrationFlow()
-    
     query = "Generate a list of even numbers"
     max_retries = 5
     final_state = flow.execute(query, max_retries=max_retries)
@@ -75,10 +73,8 @@ def test_state_preservation():
     assert final_state["max_retries"] == max_retries
 
 
-def test_classification_after_validation():
+def test_classification_after_validation(flow):
     """Test that classification only occurs after successful validation."""
-    flow = LLMOrchestrationFlow()
-    
     query = "Sort a list of numbers"
     final_state = flow.execute(query, max_retries=3)
     
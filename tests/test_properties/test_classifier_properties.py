@@ -5,12 +5,57 @@ properties of the code classification system for routing decisions.
 """
 
 import ast
+import functools
+
+import pytest
 from hypothesis import given, settings, strategies as st
 
 from llm_executor.executor.classifier import CodeClassifier
 from llm_executor.shared.models import CodeComplexity
 
 
+@pytest.fixture(scope="module")
+def classifier():
+    """Share one CodeClassifier across all examples; classification is stateless."""
+    return CodeClassifier()
+
+
+# ============================================================================
+# Verification Helpers
+# ============================================================================
+
+# The strategies below sample from small fixed lists, so the same code string
+# comes up many times; parse and scan each unique string only once.
+
+@functools.lru_cache(maxsize=None)
+def _parsed(code: str) -> ast.Module:
+    """Parse code, caching the tree per unique code string."""
+    return ast.parse(code)
+
+
+@functools.lru_cache(maxsize=None)
+def _has_heavy_import(code: str) -> bool:
+    """Check whether code imports one of the classifier's heavy libraries.
+
+    Only top-level statements are scanned: every pattern in the strategies
+    below imports at module level, so walking the whole tree is not needed.
+    """
+    for node in _parsed(code).body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                module_name = alias.name.split('.')[0]
+                if module_name in CodeClassifier.HEAVY_IMPORTS:
+                    return True
+
+        if isinstance(node, ast.ImportFrom):
+            if node.module:
+                module_name = node.module.split('.')[0]
+                if module_name in CodeClassifier.HEAVY_IMPORTS:
+                    return True
+
+    return False
+
+
 # ============================================================================
 # Custom Strategies for Code Generation
 # ============================================================================
@@ -106,8 +151,8 @@ def code_with_complex_loops(draw):
 
 # Feature: llm-python-executor, Property 12: Heavy imports trigger heavy classification
 @given(code=code_with_heavy_imports())
-@settings(max_examples=100)
-def test_heavy_imports_classification(code):
+@settings(max_examples=35)  # 7 libraries x 5 import patterns
+def test_heavy_imports_classification(classifier, code):
     """
     Property: For any code that imports heavy libraries (pandas, modin, polars,
     pyarrow, dask, ray, pyspark), the classification function must return
@@ -116,7 +161,6 @@ def test_heavy_imports_classification(code):
     This test verifies that heavy data processing libraries are consistently
     detected and routed to Kubernetes Job execution.
     """
-    classifier = CodeClassifier()
     result = classifier.classify(code)
     
     # Verify heavy classification
@@ -125,25 +169,7 @@ def test_heavy_imports_classification(code):
     
     # Verify the code actually contains a heavy import
     try:
-        tree = ast.parse(code)
-        has_heavy_import = False
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module_name = alias.name.split('.')[0]
-                    if module_name in classifier.HEAVY_IMPORTS:
-                        has_heavy_import = True
-                        break
-            
-            if isinstance(node, ast.ImportFrom):
-                if node.module:
-                    module_name = node.module.split('.')[0]
-                    if module_name in classifier.HEAVY_IMPORTS:
-                        has_heavy_import = True
-                        break
-        
-        assert has_heavy_import, \
+        assert _has_heavy_import(code), \
             f"Test code should contain a heavy import: {code}"
     except SyntaxError:
         # If there's a syntax error, the test is still valid
@@ -158,8 +184,8 @@ def test_heavy_imports_classification(code):
 
 # Feature: llm-python-executor, Property 13: File I/O triggers heavy classification
 @given(code=code_with_file_io())
-@settings(max_examples=100)
-def test_file_io_classification(code):
+@settings(max_examples=8)  # one per file I/O pattern
+def test_file_io_classification(classifier, code):
     """
     Property: For any code containing file I/O operations (open, read, write),
     the classification function must return CodeComplexity.HEAVY.
@@ -167,7 +193,6 @@ def test_file_io_classification(code):
     This test verifies that file I/O operations are consistently detected
     and routed to heavy execution environments.
     """
-    classifier = CodeClassifier()
     result = classifier.classify(code)
     
     # Verify heavy classification
@@ -188,26 +213,23 @@ def test_file_io_classification(code):
     code_with_simple_loops(),
     code_with_complex_loops()
 ))
-@settings(max_examples=100)
-def test_routing_matches_classification(code):
+@settings(max_examples=62)  # one per distinct pattern across the five strategies
+def test_routing_matches_classification(classifier, code):
     """
     Property: For any validated code, the routing decision (lightweight vs heavy)
     must match the result of the complexity classification function.
     
     This test verifies that the classification is consistent and deterministic.
-    When the same code is classified multiple times, it should always return
+    When the same code is classified again, it should always return
     the same result.
     """
-    classifier = CodeClassifier()
-    
-    # Classify the code multiple times
+    # Classify the code twice
     result1 = classifier.classify(code)
     result2 = classifier.classify(code)
-    result3 = classifier.classify(code)
     
     # Verify consistency
-    assert result1 == result2 == result3, \
-        f"Classification must be deterministic: got {result1}, {result2}, {result3} for code: {code}"
+    assert result1 == result2, \
+        f"Classification must be deterministic: got {result1}, {result2} for code: {code}"
     
     # Verify result is a valid CodeComplexity value
     assert result1 in [CodeComplexity.LIGHTWEIGHT, CodeComplexity.HEAVY], \
@@ -215,26 +237,8 @@ def test_routing_matches_classification(code):
     
     # Verify classification logic is correct based on code content
     try:
-        tree = ast.parse(code)
-        
-        # Check if code has heavy imports
-        has_heavy_import = False
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module_name = alias.name.split('.')[0]
-                    if module_name in classifier.HEAVY_IMPORTS:
-                        has_heavy_import = True
-                        break
-            if isinstance(node, ast.ImportFrom):
-                if node.module:
-                    module_name = node.module.split('.')[0]
-                    if module_name in classifier.HEAVY_IMPORTS:
-                        has_heavy_import = True
-                        break
-        
         # If code has heavy imports, it must be classified as HEAVY
-        if has_heavy_import:
+        if _has_heavy_import(code):
             assert result1 == CodeComplexity.HEAVY, \
                 f"Code with heavy imports must be classified as HEAVY: {code}"
         
@@ -251,8 +255,8 @@ def test_routing_matches_classification(code):
 
 # Feature: llm-python-executor, Property: Lightweight code classification
 @given(code=lightweight_code())
-@settings(max_examples=100)
-def test_lightweight_code_classification(code):
+@settings(max_examples=12)  # one per lightweight pattern
+def test_lightweight_code_classification(classifier, code):
     """
     Property: For any code without heavy imports, file I/O, or complex loops,
     the classification function should return CodeComplexity.LIGHTWEIGHT.
@@ -260,7 +264,6 @@ def test_lightweight_code_classification(code):
     This test verifies that simple code is correctly identified as lightweight
     and will be executed in the fast executor service.
     """
-    classifier = CodeClassifier()
     result = classifier.classify(code)
     
     # Verify lightweight classification
@@ -270,8 +273,8 @@ def test_lightweight_code_classification(code):
 
 # Feature: llm-python-executor, Property: Complex loops trigger heavy classification
 @given(code=code_with_complex_loops())
-@settings(max_examples=100)
-def test_complex_loops_classification(code):
+@settings(max_examples=3)  # one per nested loop pattern
+def test_complex_loops_classification(classifier, code):
     """
     Property: For any code with deeply nested loops (3+ levels), the
     classification function should return CodeComplexity.HEAVY.
@@ -279,7 +282,6 @@ def test_complex_loops_classification(code):
     This test verifies that computationally intensive loop structures
     are routed to heavy execution environments.
     """
-    classifier = CodeClassifier()
     result = classifier.classify(code)
     
     # Verify heavy classification
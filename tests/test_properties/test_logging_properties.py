@@ -7,9 +7,12 @@ Validates: Requirements 5.5, 6.1
 import json
 import logging
 from io import StringIO
+
+import pytest
 from hypothesis import given, settings, strategies as st
 
 from llm_executor.shared.logging_util import (
+    LOG_LEVELS,
     setup_logging,
     get_logger,
     set_request_id,
@@ -207,3 +210,30 @@ def test_request_id_context_isolation(request_id, service_name):
         # Clean up
         clear_request_id()
         logger.handlers = []
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Restore the root logger's level and handlers after setup_logging."""
+    root = logging.getLogger()
+    level, handlers = root.level, root.handlers[:]
+    yield root
+    root.setLevel(level)
+    root.handlers = handlers
+
+
+@pytest.mark.parametrize("level", ["WARN", "fatal", "NOTSET", "Info"])
+def test_setup_logging_accepts_standard_level_names(restore_root_logger, level):
+    """
+    Standard level names and their aliases are accepted case-insensitively,
+    so existing LOG_LEVEL values such as WARN keep working.
+    """
+    setup_logging("llm-service", level)
+
+    assert restore_root_logger.level == LOG_LEVELS[level.upper()]
+
+
+def test_setup_logging_rejects_unknown_level(restore_root_logger):
+    """An unknown level name raises ValueError instead of being ignored."""
+    with pytest.raises(ValueError, match="Invalid log level 'VERBOSE'"):
+        setup_logging("llm-service", "VERBOSE")
@@ -5,13 +5,35 @@ properties of the AST-based code validator.
 """
 
 import ast
+import re
 import time
+
+import pytest
 from hypothesis import given, settings, strategies as st
 
 from llm_executor.executor.validator import CodeValidator
 from llm_executor.shared.models import ValidationResult
 
 
+# Keywords expected in error messages for each kind of restricted operation,
+# compiled once so each example does a single scan of the error text
+FILE_ERROR_PATTERN = re.compile(
+    r"file|i/o|open|read|write|import|pathlib|io", re.IGNORECASE
+)
+OS_ERROR_PATTERN = re.compile(
+    r"os|command|execution|system|subprocess|eval|exec|compile|import", re.IGNORECASE
+)
+NETWORK_ERROR_PATTERN = re.compile(
+    r"network|socket|http|request|url", re.IGNORECASE
+)
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Share one CodeValidator across all examples; validation is stateless."""
+    return CodeValidator()
+
+
 # ============================================================================
 # Custom Strategies for Code Generation
 # ============================================================================
@@ -134,7 +156,7 @@ def code_with_restricted_operations(draw):
 # Feature: llm-python-executor, Property 4: AST parsing performance
 @given(code=valid_python_code())
 @settings(max_examples=100)
-def test_ast_parsing_performance(code):
+def test_ast_parsing_performance(validator, code):
     """
     Property: For any valid Python code string, AST parsing must complete
     within 30 milliseconds.
@@ -142,8 +164,6 @@ def test_ast_parsing_performance(code):
     This test verifies that the validator can parse code quickly enough
     to meet the performance requirements.
     """
-    validator = CodeValidator()
-    
     # Measure parsing time
     start_time = time.perf_counter()
     result = validator.validate(code)
@@ -168,7 +188,7 @@ def test_ast_parsing_performance(code):
 # Feature: llm-python-executor, Property 5: Restricted operations are rejected
 @given(code=code_with_file_operations())
 @settings(max_examples=100)
-def test_file_operations_rejected(code):
+def test_file_operations_rejected(validator, code):
     """
     Property: For any code containing file I/O operations, the validator
     must reject the code and return specific error messages.
@@ -176,7 +196,6 @@ def test_file_operations_rejected(code):
     This test verifies that file operations are consistently detected
     and rejected.
     """
-    validator = CodeValidator()
     result = validator.validate(code)
     
     # Verify code is rejected
@@ -189,15 +208,14 @@ def test_file_operations_rejected(code):
     
     # Verify error message mentions file operations or unauthorized imports
     # (file I/O can be caught by either the file I/O rule or import rule)
-    error_text = " ".join(result.errors).lower()
-    assert any(keyword in error_text for keyword in ["file", "i/o", "open", "read", "write", "import", "pathlib", "io"]), \
+    assert FILE_ERROR_PATTERN.search(" ".join(result.errors)), \
         f"Error message should mention file operations or imports: {result.errors}"
 
 
 # Feature: llm-python-executor, Property 5: Restricted operations are rejected
 @given(code=code_with_os_commands())
 @settings(max_examples=100)
-def test_os_commands_rejected(code):
+def test_os_commands_rejected(validator, code):
     """
     Property: For any code containing OS command execution, the validator
     must reject the code and return specific error messages.
@@ -205,7 +223,6 @@ def test_os_commands_rejected(code):
     This test verifies that OS commands are consistently detected
     and rejected.
     """
-    validator = CodeValidator()
     result = validator.validate(code)
     
     # Verify code is rejected
@@ -217,15 +234,14 @@ def test_os_commands_rejected(code):
         "Rejected code must have error messages"
     
     # Verify error message mentions OS operations or specific commands
-    error_text = " ".join(result.errors).lower()
-    assert any(keyword in error_text for keyword in ["os", "command", "execution", "system", "subprocess", "eval", "exec", "compile", "import"]), \
+    assert OS_ERROR_PATTERN.search(" ".join(result.errors)), \
         f"Error message should mention OS operations: {result.errors}"
 
 
 # Feature: llm-python-executor, Property 5: Restricted operations are rejected
 @given(code=code_with_network_operations())
 @settings(max_examples=100)
-def test_network_operations_rejected(code):
+def test_network_operations_rejected(validator, code):
     """
     Property: For any code containing network operations, the validator
     must reject the code and return specific error messages.
@@ -233,7 +249,6 @@ def test_network_operations_rejected(code):
     This test verifies that network operations are consistently detected
     and rejected.
     """
-    validator = CodeValidator()
     result = validator.validate(code)
     
     # Verify code is rejected
@@ -245,8 +260,7 @@ def test_network_operations_rejected(code):
         "Rejected code must have error messages"
     
     # Verify error message mentions network operations
-    error_text = " ".join(result.errors).lower()
-    assert any(keyword in error_text for keyword in ["network", "socket", "http", "request", "url"]), \
+    assert NETWORK_ERROR_PATTERN.search(" ".join(result.errors)), \
         f"Error message should mention network operations: {result.errors}"
 
 
@@ -258,7 +272,7 @@ def test_network_operations_rejected(code):
 # Feature: llm-python-executor, Property 6: Unauthorized imports are detected
 @given(code=code_with_unauthorized_imports())
 @settings(max_examples=100)
-def test_unauthorized_imports_detected(code):
+def test_unauthorized_imports_detected(validator, code):
     """
     Property: For any code containing unauthorized imports, the validator
     must reject the code and identify the specific prohibited import names
@@ -267,7 +281,6 @@ def test_unauthorized_imports_detected(code):
     This test verifies that unauthorized imports are consistently detected
     and reported with specific module names.
     """
-    validator = CodeValidator()
     result = validator.validate(code)
     
     # Verify code is rejected
@@ -306,7 +319,7 @@ def test_unauthorized_imports_detected(code):
 # Feature: llm-python-executor, Property 6: Unauthorized imports are detected
 @given(code=code_with_authorized_imports())
 @settings(max_examples=100)
-def test_authorized_imports_accepted(code):
+def test_authorized_imports_accepted(validator, code):
     """
     Property: For any code containing only authorized imports, the validator
     must accept the code (assuming no other violations).
@@ -314,7 +327,6 @@ def test_authorized_imports_accepted(code):
     This test verifies that the allowlist works correctly and doesn't
     reject safe imports.
     """
-    validator = CodeValidator()
     result = validator.validate(code)
     
     # Verify code is accepted (no import-related errors)